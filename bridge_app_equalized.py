@@ -4,45 +4,80 @@
 Bridge Temporary Evaluation – Equalized Layout
 - Three rows with equal height (uniform grid rows)
 - N (top) and S (bottom) centered horizontally and the SAME width/height as W/E columns
-- Inline cards rendered as Label "buttons" with full solid color fill on toggle
+- Inline cards drawn on one Canvas per suit as solid "buttons" that fill on toggle
 - Enter/Tab jumps to next suit; auto-mark when replacing a single 'X' with one rank
 - Per-player Cards counter (total across suits)
 - Center "table" square with N/E/S/W tiles toggling green <-> red on click
 """
 
+import functools
+import json
 import tkinter as tk
 from tkinter import ttk, messagebox
 import tkinter.font as tkfont
-from collections import Counter, defaultdict
+from collections import defaultdict
 
 RANKS_ORDER = ['A', 'K', 'Q', 'J', 'T', '9', '8', '7', '6', '5', '4', '3', '2', 'X']
 RANK_VALUES = {'A': 4, 'K': 3, 'Q': 2, 'J': 1}
 SUITS = [('S', '♠'), ('H', '♥'), ('D', '♦'), ('C', '♣')]
+_SUIT_CODES = ('S', 'H', 'D', 'C')
+_PLAYER_CODES = ('N', 'E', 'S', 'W')
+_JSON_ENCODE = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+_SUMMARY_FMT = "Total cards: {t} | ♠{S} ♥{H} ♦{D} ♣{C} | Min pts: {mn} | Max pts: {mx}".format
 
+_RANKS_SET = frozenset(RANKS_ORDER)
+_RANK_INDEX = {r: i for i, r in enumerate(RANKS_ORDER)}
+_NORMALIZE_TABLE = str.maketrans({',': ' ', '-': ' ', '.': ' ', '0': 'T'})
+
+@functools.lru_cache(maxsize=2048)
 def normalize_cards(text):
     if text is None:
         return ""
-    raw = text.strip().upper().replace(',', ' ').replace('-', ' ').replace('.', ' ')
-    raw = raw.replace('10', 'T')
-    parts = [p for p in raw.split() if p]
-    tokens = list(parts[0]) if len(parts) == 1 else [ch for p in parts for ch in p]
-    tokens = ['T' if t == '0' else t for t in tokens]
-    tokens = [t for t in tokens if t in RANKS_ORDER]
-    tokens_sorted = sorted(tokens, key=lambda t: RANKS_ORDER.index(t))
+    # '10' -> 'T' folds into '0' -> 'T'; the leftover '1' and separators are filtered below
+    raw = text.strip().upper().translate(_NORMALIZE_TABLE)
+    tokens = [t for t in raw if t in _RANKS_SET]
+    tokens_sorted = sorted(tokens, key=_RANK_INDEX.__getitem__)
     return ''.join(tokens_sorted)
 
+@functools.lru_cache(maxsize=2048)
 def hcp_from_cards(cards):
-    return sum(RANK_VALUES.get(ch, 0) for ch in cards)
+    return sum(v * cards.count(r) for r, v in RANK_VALUES.items())
+
+def _set_if(var, value):
+    # skip the Tcl write (and its traces) when nothing changed
+    if var.get() != value:
+        var.set(value)
+
+def _entry_to_int(entry):
+    try:
+        v = entry.get().strip()
+        return int(v) if v else 0
+    except Exception:
+        return 0
 
 class HandFrame(ttk.LabelFrame):
+    _NEXT_SUIT = {'S': 'H', 'H': 'D', 'D': 'C', 'C': 'S'}
+    # card "button" geometry on the suit strip canvas
+    _CARD_W, _CARD_H, _CARD_GAP = 22, 24, 2
+
     def __init__(self, master, player_label, on_change=None, *args, **kwargs):
         super().__init__(master, text=f" {player_label} ", padding=(6, 4), *args, **kwargs)
+        self.player_label = player_label
         self.on_change = on_change
 
         self.last_cards = {sc: "" for sc, _ in SUITS}
         self.played_counts = {sc: defaultdict(int) for sc, _ in SUITS}
         self.card_strips = {}
+        self._strip_cards = {}
+        self._strip_played = {}
+        self._strip_items = {}
         self.cards_entries = {}
+        # per-suit HCP/length, kept in sync with the card vars
+        self._suit_hcp = {sc: 0 for sc, _ in SUITS}
+        self._suit_len = {sc: 0 for sc, _ in SUITS}
+        # per-suit part of get_state(), rebuilt only after a mutation
+        self._state_dirty = True
+        self._cached_suits = None
 
         row = 0
         ttk.Label(self, text="Pts").grid(row=row, column=0, sticky="w", padx=(0,4))
@@ -80,54 +115,21 @@ class HandFrame(ttk.LabelFrame):
             cards_entry.grid(row=row, column=2, sticky="w")
             self.cards_entries[suit_code] = cards_entry
 
-            strip = ttk.Frame(self)
+            strip = tk.Canvas(self, width=0, height=self._CARD_H, highlightthickness=0)
             strip.grid(row=row, column=3, sticky="we", padx=(6,0))
+            strip.tag_bind("card", "<Button-1>", functools.partial(self._on_card_click, suit_code))
             self.card_strips[suit_code] = strip
-
-            def on_cards_change(evt=None, sc=suit_code, var=cards_var, cntv=cnt_var):
-                old = self.last_cards[sc]
-                new_norm = normalize_cards(var.get())
-                if new_norm != var.get().upper():
-                    var.set(new_norm)
-                cntv.set(str(len(new_norm)))
-                self.update_stats()
-
-                # auto-mark a single new rank that replaced one 'X'
-                old_norm = normalize_cards(old)
-                if old_norm:
-                    old_counter = Counter(old_norm)
-                    new_counter = Counter(new_norm)
-                    delta_x = old_counter.get('X', 0) - new_counter.get('X', 0)
-                    added = {r: new_counter[r] - old_counter.get(r, 0) for r in new_counter if r != 'X'}
-                    added = {r: c for r, c in added.items() if c > 0}
-                    if delta_x == 1 and sum(added.values()) == 1:
-                        added_rank = next(iter(added.keys()))
-                        self.played_counts[sc][added_rank] += 1
-
-                self.last_cards[sc] = new_norm
-                self.rebuild_card_strip(sc)
-
-                if evt and str(evt.keysym) in ("Return", "Tab"):
-                    self.focus_next_suit(sc)
-                    return "break"
-
-            cards_entry.bind("<FocusOut>", on_cards_change)
-            cards_entry.bind("<Return>", on_cards_change)
-            cards_entry.bind("<Tab>", on_cards_change)
-
-            def on_count_change(*args, sc=suit_code, var=cards_var, entry=cards_entry):
-                try:
-                    desired = int(self.suit_count_vars[sc].get())
-                except Exception:
-                    return
-                cards = var.get()
-                # ttk.Entry background may be theme-controlled, but try:
-                try:
-                    entry.config(background="#fff4f4" if len(cards) != desired else "white")
-                except tk.TclError:
-                    pass
-
-            cnt_var.trace_add("write", on_count_change)
+            self._strip_cards[suit_code] = ""
+            # (rect, text) item ids, reused across rebuilds and hidden when unused
+            self._strip_items[suit_code] = []
+
+            cards_entry._suit_code = suit_code
+            cards_entry.bind("<FocusOut>", self._on_cards_change)
+            cards_entry.bind("<Return>", self._on_cards_change)
+            cards_entry.bind("<Tab>", self._on_cards_change)
+            cnt_var.trace_add("write", functools.partial(self._on_count_change, suit_code))
+            # typing alone doesn't fire the bindings above, so track raw edits too
+            cards_var.trace_add("write", self._mark_state_dirty)
 
             self.rebuild_card_strip(suit_code)
             row += 1
@@ -143,99 +145,172 @@ class HandFrame(ttk.LabelFrame):
         self.grid_columnconfigure(2, weight=0)
         self.grid_columnconfigure(3, weight=1)
 
-    def focus_next_suit(self, current_suit_code):
-        order = ['S', 'H', 'D', 'C']
+    def _on_cards_change(self, evt):
+        sc = evt.widget._suit_code
+        var = self.suit_card_vars[sc]
+        self._state_dirty = True
+        old = self.last_cards[sc]
+        raw = var.get()
+        new_norm = normalize_cards(raw)
+        if new_norm != raw:
+            var.set(new_norm)
+        n = len(new_norm)
+        _set_if(self.suit_count_vars[sc], str(n))
+        self._suit_hcp[sc] = hcp_from_cards(new_norm)
+        self._suit_len[sc] = n
+        self.update_stats()
+
+        # auto-mark a single new rank that replaced one 'X'
+        old_norm = normalize_cards(old)
+        if old_norm and old_norm.count('X') - new_norm.count('X') == 1:
+            added = {r: new_norm.count(r) - old_norm.count(r) for r in set(new_norm) if r != 'X'}
+            added = {r: c for r, c in added.items() if c > 0}
+            if sum(added.values()) == 1:
+                added_rank = next(iter(added.keys()))
+                self.played_counts[sc][added_rank] += 1
+
+        self.last_cards[sc] = new_norm
+        self.rebuild_card_strip(sc)
+
+        if str(evt.keysym) in ("Return", "Tab"):
+            self.focus_next_suit(sc)
+            return "break"
+
+    def _mark_state_dirty(self, *args):
+        self._state_dirty = True
+
+    def _on_count_change(self, suit_code, *args):
+        self._state_dirty = True
         try:
-            idx = order.index(current_suit_code)
-            next_suit = order[(idx + 1) % len(order)]
-            self.cards_entries[next_suit].focus_set()
-            self.cards_entries[next_suit].icursor('end')
+            desired = int(self.suit_count_vars[suit_code].get())
         except Exception:
+            return
+        cards = self.suit_card_vars[suit_code].get()
+        # ttk.Entry background may be theme-controlled, but try:
+        try:
+            self.cards_entries[suit_code].config(background="#fff4f4" if len(cards) != desired else "white")
+        except tk.TclError:
             pass
 
-    # Label-based "buttons" with full solid color
+    def focus_next_suit(self, current_suit_code):
+        next_suit = self._NEXT_SUIT.get(current_suit_code)
+        if next_suit:
+            entry = self.cards_entries[next_suit]
+            entry.focus_set()
+            entry.icursor('end')
+
+    # Canvas-drawn "buttons" with full solid color
+    def _on_card_click(self, suit_code, evt):
+        for tag in self.card_strips[suit_code].gettags("current"):
+            if tag.startswith("card_"):
+                self.toggle_card(suit_code, int(tag[5:]))
+                return
+
+    def toggle_card(self, suit_code, index):
+        r = self._strip_cards[suit_code][index]
+        if r == 'X':
+            return
+        played = self._strip_played[suit_code]
+        counts = self.played_counts[suit_code]
+        strip = self.card_strips[suit_code]
+        played[index] = not played[index]
+        self._state_dirty = True
+        if played[index]:
+            strip.itemconfigure(f"rect_{index}", fill="#6fff6f")
+            counts[r] = counts.get(r, 0) + 1
+        else:
+            strip.itemconfigure(f"rect_{index}", fill="#ffffff")
+            if counts.get(r, 0) > 0:
+                counts[r] -= 1
+
+    def _create_card_items(self, strip, i):
+        x = 1 + i * (self._CARD_W + self._CARD_GAP)
+        rect = strip.create_rectangle(
+            x, 1, x + self._CARD_W, self._CARD_H - 1,
+            fill="#ffffff", outline="#000000", width=1,
+            tags=("card", f"card_{i}", f"rect_{i}")
+        )
+        text = strip.create_text(
+            x + self._CARD_W / 2, self._CARD_H / 2,
+            fill="#000000", font=("TkDefaultFont", 10, "bold"),
+            tags=("card", f"card_{i}")
+        )
+        return rect, text
+
     def rebuild_card_strip(self, suit_code):
         strip = self.card_strips[suit_code]
-        for w in strip.winfo_children():
-            w.destroy()
+        items = self._strip_items[suit_code]
         cards = self.suit_card_vars[suit_code].get()
-        played_counts = self.played_counts[suit_code]
-        used_played = Counter()
+        # played marks still to hand out, consumed left to right
+        remaining = dict(self.played_counts[suit_code])
+        played = []
+        step = self._CARD_W + self._CARD_GAP
 
-        for rank in cards:
+        for i, rank in enumerate(cards):
             is_played = False
-            if rank != 'X' and used_played[rank] < played_counts.get(rank, 0):
+            if rank != 'X' and remaining.get(rank, 0) > 0:
                 is_played = True
-                used_played[rank] += 1
-
-            lbl = tk.Label(
-                strip,
-                text=rank,
-                width=2,
-                height=1,
-                font=("TkDefaultFont", 10, "bold"),
-                bd=1,
-                relief="solid",
-                fg="#000000",
-                bg="#6fff6f" if is_played else "#ffffff",
-            )
-            lbl._played = is_played
-
-            def on_toggle(e=None, l=lbl, r=rank):
-                if r == 'X':
-                    return
-                l._played = not getattr(l, "_played", False)
-                if l._played:
-                    l.configure(bg="#6fff6f", fg="#000000")
-                    self.played_counts[suit_code][r] = self.played_counts[suit_code].get(r, 0) + 1
-                else:
-                    l.configure(bg="#ffffff", fg="#000000")
-                    if self.played_counts[suit_code].get(r, 0) > 0:
-                        self.played_counts[suit_code][r] -= 1
-
-            lbl.bind("<Button-1>", on_toggle)
-            lbl.pack(side="left", padx=1, pady=1, ipadx=4, ipady=2)
+                remaining[rank] -= 1
+            played.append(is_played)
+
+            if i == len(items):
+                items.append(self._create_card_items(strip, i))
+            rect, text = items[i]
+            strip.itemconfigure(rect, fill="#6fff6f" if is_played else "#ffffff", state="normal")
+            strip.itemconfigure(text, text=rank, state="normal")
+
+        # only the cards shown by the previous rebuild need hiding
+        for i in range(len(cards), len(self._strip_cards[suit_code])):
+            strip.itemconfigure(f"card_{i}", state="hidden")
+
+        self._strip_cards[suit_code] = cards
+        self._strip_played[suit_code] = played
+        strip.configure(width=len(cards) * step)
 
     def sort_all(self):
+        self._state_dirty = True
         for sc, var in self.suit_card_vars.items():
             norm = normalize_cards(var.get())
-            var.set(norm)
-            self.suit_count_vars[sc].set(str(len(norm)))
+            _set_if(var, norm)
+            _set_if(self.suit_count_vars[sc], str(len(norm)))
+            self._suit_hcp[sc] = hcp_from_cards(norm)
+            self._suit_len[sc] = len(norm)
             self.last_cards[sc] = norm
             self.rebuild_card_strip(sc)
         self.update_stats()
 
     def clear_all(self):
+        self._state_dirty = True
         self.points_min.delete(0, 'end')
         self.points_max.delete(0, 'end')
         for sc in list(self.suit_card_vars.keys()):
             self.suit_card_vars[sc].set("")
             self.suit_count_vars[sc].set("")
             self.last_cards[sc] = ""
+            self._suit_hcp[sc] = 0
+            self._suit_len[sc] = 0
             self.played_counts[sc].clear()
             self.rebuild_card_strip(sc)
         self.update_stats()
 
     def update_stats(self):
-        total_hcp = 0
-        total_cards = 0
-        for sc, var in self.suit_card_vars.items():
-            cards = var.get()
-            total_hcp += hcp_from_cards(cards)
-            total_cards += len(cards)
-        self.hcp_var.set(str(total_hcp))
-        self.cards_total_var.set(str(total_cards))
+        _set_if(self.hcp_var, str(sum(self._suit_hcp.values())))
+        _set_if(self.cards_total_var, str(sum(self._suit_len.values())))
         if callable(self.on_change):
             self.on_change()
 
     def get_state(self):
-        suits = {}
-        for sc in self.suit_card_vars:
-            suits[sc] = {
-                'count': self.suit_count_vars[sc].get(),
-                'cards': self.suit_card_vars[sc].get(),
-                'played': dict(self.played_counts[sc]),
-            }
+        if self._state_dirty:
+            suits = {}
+            for sc in self.suit_card_vars:
+                suits[sc] = {
+                    'count': self.suit_count_vars[sc].get(),
+                    'cards': self.suit_card_vars[sc].get(),
+                    'played': dict(self.played_counts[sc]),
+                }
+            self._cached_suits = suits
+            self._state_dirty = False
+        suits = self._cached_suits
         return {
             'player': self.player_label,
             'points_range': (self.points_min.get(), self.points_max.get()),
@@ -363,14 +438,15 @@ class BridgeApp(tk.Tk):
         for letter, (cx, cy) in positions.items():
             x0, y0 = cx - tile_w / 2, cy - tile_h / 2
             x1, y1 = cx + tile_w / 2, cy + tile_h / 2
+            tags = ("tile", f"tile_{letter}")
             rect = cv.create_rectangle(
                 x0, y0, x1, y1,
                 fill=self.table_colors[letter],
-                outline="#222222", width=1
+                outline="#222222", width=1, tags=tags
             )
-            text = cv.create_text(cx, cy, text=letter, font=("TkDefaultFont", 12, "bold"))
-            cv.tag_bind(rect, "<Button-1>", lambda e, L=letter: self._toggle_table_letter(L))
-            cv.tag_bind(text, "<Button-1>", lambda e, L=letter: self._toggle_table_letter(L))
+            text = cv.create_text(cx, cy, text=letter, font=("TkDefaultFont", 12, "bold"), tags=tags)
+            # one binding per tile covers both its rectangle and its letter
+            cv.tag_bind(f"tile_{letter}", "<Button-1>", lambda e, L=letter: self._toggle_table_letter(L))
             self.table_items[letter] = (rect, text)
 
     def _toggle_table_letter(self, letter):
@@ -423,16 +499,18 @@ class BridgeApp(tk.Tk):
 
     def validate_all(self):
         msgs = []
-        for pl in ['N','E','S','W']:
+        for pl in _PLAYER_CODES:
             hf = self.frames[pl]
-            total = 0
-            for sc in ['S','H','D','C']:
+            suit_len = hf._suit_len
+            for sc in _SUIT_CODES:
                 cnt_str = hf.suit_count_vars[sc].get().strip()
-                cards = hf.suit_card_vars[sc].get().strip()
-                cnt = int(cnt_str) if cnt_str.isdigit() else None
-                if cnt is not None and cnt != len(cards):
-                    msgs.append(f"{pl} {sc}: count {cnt} != cards length {len(cards)} ('{cards}')")
-                total += len(cards)
+                if not cnt_str.isdigit():
+                    continue
+                cnt = int(cnt_str)
+                if cnt != suit_len[sc]:
+                    cards = hf.suit_card_vars[sc].get().strip()
+                    msgs.append(f"{pl} {sc}: count {cnt} != cards length {suit_len[sc]} ('{cards}')")
+            total = sum(suit_len.values())
             if total and total != 13:
                 msgs.append(f"{pl}: has {total} cards (should be 13).")
         if msgs:
@@ -441,9 +519,8 @@ class BridgeApp(tk.Tk):
             messagebox.showinfo("Validation", "All good!")
 
     def dump_state(self):
-        import json
-        state = {pl: self.frames[pl].get_state() for pl in ['N','E','S','W']}
-        print(json.dumps(state, indent=2))
+        state = {pl: self.frames[pl].get_state() for pl in _PLAYER_CODES}
+        print(_JSON_ENCODE(state))
         messagebox.showinfo("Dumped", "Current state printed to console.")
 
     def sort_all_hands(self):
@@ -455,13 +532,21 @@ class BridgeApp(tk.Tk):
             hf.clear_all()
 
     def update_global_stats(self):
+        """Debounce the summary refresh so bursts of edits trigger one rebuild."""
+        if getattr(self, "_stats_pending", False):
+            return
+        self._stats_pending = True
+        self.after_idle(self._do_update_global_stats)
+
+    def _do_update_global_stats(self):
+        self._stats_pending = False
         # totals across all four hands
         total_cards = 0
-        suit_totals = {'S': 0, 'H': 0, 'D': 0, 'C': 0}
+        suit_totals = dict.fromkeys(_SUIT_CODES, 0)
         min_points_sum = 0
         max_points_sum = 0
 
-        for pl in ['N','E','S','W']:
+        for pl in _PLAYER_CODES:
             hf = self.frames.get(pl)
             if not hf:
                 continue
@@ -473,21 +558,13 @@ class BridgeApp(tk.Tk):
                 hcp = 0
 
             # Pts min/max from entries (blank -> 0)
-            def _to_int(entry):
-                try:
-                    v = entry.get().strip()
-                    return int(v) if v else 0
-                except Exception:
-                    return 0
-
-            pts_min = _to_int(hf.points_min)
-            pts_max = _to_int(hf.points_max)
+            pts_min = _entry_to_int(hf.points_min)
+            pts_max = _entry_to_int(hf.points_max)
 
             # suits/cards
             hand_cards = 0
-            for sc in ['S','H','D','C']:
-                cards = hf.suit_card_vars[sc].get()
-                n = len(cards)
+            for sc in _SUIT_CODES:
+                n = hf._suit_len[sc]
                 suit_totals[sc] += n
                 hand_cards += n
             total_cards += hand_cards
@@ -497,12 +574,8 @@ class BridgeApp(tk.Tk):
             max_points_sum += max(hcp, pts_max)
 
         # Build summary line
-        summary = (
-            f"Total cards: {total_cards} | "
-            f"♠{suit_totals['S']} ♥{suit_totals['H']} ♦{suit_totals['D']} ♣{suit_totals['C']} | "
-            f"Min pts: {min_points_sum} | Max pts: {max_points_sum}"
-        )
-        self.summary_var.set(summary)
+        summary = _SUMMARY_FMT(t=total_cards, mn=min_points_sum, mx=max_points_sum, **suit_totals)
+        _set_if(self.summary_var, summary)
 
 
 if __name__ == "__main__":